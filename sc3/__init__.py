@@ -16,6 +16,7 @@ LIB_SETUP_FILE = None
 # https://docs.python.org/3/howto/logging-cookbook.html#dealing-with-handlers-that-block
 
 def _init_logger(verbosity, blocking=False):
+    import copy
     import queue
     import logging
     import logging.handlers
@@ -29,8 +30,18 @@ def _init_logger(verbosity, blocking=False):
         root_logger = logging.getLogger()
         root_logger.addHandler(handler)
     else:
+        class _QueueHandler(logging.handlers.QueueHandler):
+            # The queue is in-process, records keep exc_info so tracebacks
+            # are formatted by the listener's thread instead of the caller's
+            # (e.g. a clock thread logging an error from a task).
+            def prepare(self, record):
+                record = copy.copy(record)
+                record.msg = record.getMessage()
+                record.args = None
+                return record
+
         q = queue.Queue(-1)
-        queue_handler = logging.handlers.QueueHandler(q)
+        queue_handler = _QueueHandler(q)
         listener_handler = logging.StreamHandler()
         listener_handler.setFormatter(formatter)
         listener = logging.handlers.QueueListener(q, listener_handler)
@@ -92,11 +92,18 @@ class OscInterface(ABC):
         try:
             elapsed_time = _libsc3.main.elapsed_time()
             packet = oli.OscPacket(data)
+            # Messages are sorted by time, the timetag of
+            # each bundle is converted only once.
+            timetag = bundle_time = None
             for timed_msg in packet.messages:
                 if timed_msg.time is None or timed_msg.time == oli.IMMEDIATELY:
                     time = elapsed_time
                 else:
-                    time = clk.SystemClock.osc_to_elapsed_time(timed_msg.time)
+                    if timed_msg.time != timetag:
+                        timetag = timed_msg.time
+                        bundle_time = clk.SystemClock.osc_to_elapsed_time(
+                            timetag)
+                    time = bundle_time
                 self._msg_dispatch(
                     address, time,
                     *[timed_msg.message.address,
@@ -446,7 +453,7 @@ class OscNrtInterface(OscInterface):
         # always absolute time (from zero as reference time).
         if _libsc3.main.current_tt is not _libsc3.main.main_tt:
             time += send_time
-        return int(time * clk.SystemClock._SECONDS_TO_OSC)
+        return int(time * clk._SECONDS_TO_OSC)
 
     def _send(self, msg, target):
         pass
@@ -476,7 +483,7 @@ class OscScore():
 
     @property
     def duration(self):
-        return self._scoreq.peek(False)[0] * clk.SystemClock._OSC_TO_SECONDS
+        return self._scoreq.peek(False)[0] * clk._OSC_TO_SECONDS
 
     def add(self, bndl):
         if self._finished:
@@ -1,3 +1,4 @@
+import functools
 import re
 
 
@@ -36,9 +37,14 @@ def _rewrite_func(match):
     return _rewrite_symbols[match.group(0)]
 
 
+@functools.lru_cache(maxsize=256)
+def osc_compile_pattern(pattern):
+    # Incoming patterns repeat, the rewrite and compile is done once.
+    return re.compile(re.sub(_rewrite_pattern, _rewrite_func, pattern))
+
+
 def osc_rematch_pattern(pattern, address):
-    pattern = re.sub(_rewrite_pattern, _rewrite_func, pattern)
-    return re.match(pattern, address) is not None
+    return osc_compile_pattern(pattern).match(address) is not None
 
 
 ### Option 2 ###
@@ -66,22 +66,25 @@ class TaskQueue():
 
         '''
 
-        if self._queue:
-            if smallest:
-                prio, count, task = heapq.nsmallest(
-                    1, self._queue, key=self._small_key)[0]
-            else:
-                prio, count, task = heapq.nlargest(
-                    1, self._queue, key=self._large_key)[0]
+        if smallest:
+            # The head of the heap is the smallest entry, removed entries
+            # found there are discarded so peek is O(1) in the common case.
+            self._discard_removed_head()
+            if self._queue:
+                prio, count, task = self._queue[0]
+                return (prio, task)
+        elif self._queue:
+            prio, count, task = heapq.nlargest(
+                1, self._queue, key=self._large_key)[0]
             if task is not self._REMOVED:
                 return (prio, task)
         raise KeyError('peek from an empty task queue')
 
-    def _small_key(self, item):
-        if item[2] is type(self)._REMOVED:
-            return [float('inf')] * 2
-        else:
-            return item[:2]
+    def _discard_removed_head(self):
+        queue = self._queue
+        while queue and queue[0][2] is type(self)._REMOVED:
+            heapq.heappop(queue)
+            self._removed_counter -= 1
 
     def _large_key(self, item):
         if item[2] is type(self)._REMOVED:
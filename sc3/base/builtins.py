@@ -193,8 +193,8 @@ def coin(x):
             return True
     raise TypeError
 
-@scbuiltin.binop
-def rrand(a, b):
+def rrand_number(a, b):
+    # Unwrapped numeric rrand for internal calls with plain numbers.
     if type(a) is float or type(b) is float:
         return a + _libsc3.main._rgen.random() * (b - a)
     elif type(a) is type(b) is int:
@@ -207,6 +207,10 @@ def rrand(a, b):
             return _libsc3.main._rgen.randrange(a, b, -1)
     raise TypeError
 
+@scbuiltin.binop
+def rrand(a, b):
+    return rrand_number(a, b)
+
 @scbuiltin.binop
 def exprand(a, b):  # exprandrng
     return a * exp(log(b / a) * _libsc3.main._rgen.random())
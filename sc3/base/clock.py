@@ -1,5 +1,7 @@
 """Clock.sc"""
 
+import heapq
+import itertools
 import logging
 import threading
 import weakref
@@ -21,6 +23,13 @@ __all__ = [
 _logger = logging.getLogger(__name__)
 
 
+# OSC timetag conversion constants.
+_SECONDS_FROM_1900_TO_1970 = 2208988800  # 17 leap years
+_OSC_EPOCH_OFFSET = _SECONDS_FROM_1900_TO_1970 << 32
+_SECONDS_TO_OSC = 4294967296.0  # 2 ** 32
+_OSC_TO_SECONDS = 1 / 4294967296
+
+
 class ClockError(RuntimeError):
     pass
 
@@ -118,6 +127,8 @@ class MetaSystemClock(MetaClock):
         def init_func(cls):
             if _libsc3.main is _libsc3.RtMain:
                 cls._task_queue = tsq.TaskQueue()
+                # The clock's thread is the only waiter of _sched_cond,
+                # notify() is enough to wake it up.
                 cls._sched_cond = threading.Condition(_libsc3.main._main_lock)
                 cls._thread = threading.Thread(
                     target=cls._run,
@@ -152,28 +163,30 @@ class SystemClock(Clock, metaclass=MetaSystemClock):
 
     '''
 
-    _SECONDS_FROM_1900_TO_1970 = 2208988800  # 17 leap years
-    _SECONDS_TO_OSC = pow(2, 32) / 1
-    _OSC_TO_SECONDS = 1 / pow(2, 32)
-
     def __new__(cls):
         return cls
 
     @classmethod
     def _sched_init(cls):
         # _init_time was moved to main because rt/nrt clock switch.
-        offset = (_libsc3.main._init_time + cls._SECONDS_FROM_1900_TO_1970)
-        cls._elapsed_osc_offset = int(offset * cls._SECONDS_TO_OSC)
+        # Seconds and fraction are scaled separately, adding the epoch
+        # offset to the float time would lose sub-microsecond precision.
+        init_time = _libsc3.main._init_time
+        seconds = int(init_time)
+        fraction = init_time - seconds  # Exact.
+        cls._elapsed_osc_offset = (
+            _OSC_EPOCH_OFFSET + (seconds << 32) +
+            int(fraction * _SECONDS_TO_OSC))
 
     @classmethod
     def elapsed_time_to_osc(cls, elapsed: float) -> int:  # int64
         '''Convert elapsed time in seconds to OSC timetag format.'''
-        return int(elapsed * cls._SECONDS_TO_OSC) + cls._elapsed_osc_offset
+        return int(elapsed * _SECONDS_TO_OSC) + cls._elapsed_osc_offset
 
     @classmethod
     def osc_to_elapsed_time(cls, osctime: int) -> float:
         '''Convert time in OSC timetag format to elapsed time in seconds.'''
-        return float(osctime - cls._elapsed_osc_offset) * cls._OSC_TO_SECONDS
+        return (osctime - cls._elapsed_osc_offset) * _OSC_TO_SECONDS
 
     @classmethod
     def osc_time(cls) -> int:
@@ -182,14 +195,13 @@ class SystemClock(Clock, metaclass=MetaSystemClock):
 
     @classmethod
     def _sched_add(cls, secs, task):
-        # Call with acquired lock.
-        if cls._task_queue.empty():
-            prev_time = -1e10
-        else:
-            prev_time = cls._task_queue.peek()[0]
-        cls._task_queue.add(secs, task)
-        if cls._task_queue.peek()[0] != prev_time:
-            cls._sched_cond.notify_all()
+        # Call with acquired lock. The scheduler only
+        # needs to wake up if the task is the new head.
+        queue = cls._task_queue
+        new_head = queue.empty() or secs < queue.peek()[0]
+        queue.add(secs, task)
+        if new_head:
+            cls._sched_cond.notify()
 
     @classmethod
     def _sched_stop(cls):
@@ -198,57 +210,58 @@ class SystemClock(Clock, metaclass=MetaSystemClock):
         with cls._sched_cond:
             cls._task_queue.clear()
             cls._run_sched = False
-            cls._sched_cond.notify_all()
+            cls._sched_cond.notify()
         cls._thread.join()
 
     @classmethod
     def _run(cls):
         cls._run_sched = True
 
-        with cls._sched_cond:
-            while True:
+        # Main is set before clocks' threads start and doesn't change
+        # while they run, lookups are bound once for the loop.
+        main = _libsc3.main
+        elapsed_time = main.elapsed_time
+        update_logical_time = main._update_logical_time
+        queue = cls._task_queue
+        cond = cls._sched_cond
+        sched_add = cls._sched_add
+
+        # The lock is held while tasks are performed, it's released
+        # only by wait. Each pass checks the head of the queue once.
+        with cond:
+            while cls._run_sched:
                 # // wait until there is something in scheduler
-                while cls._task_queue.empty():
-                    cls._sched_cond.wait()
-                    if not cls._run_sched:
-                        return
+                if queue.empty():
+                    cond.wait()
+                    continue
 
                 # // wait until an event is ready
-                now = 0
-                while not cls._task_queue.empty():
-                    now = _libsc3.main.elapsed_time()
-                    sched_secs = cls._task_queue.peek()[0]
-                    if now >= sched_secs:
-                        break
-                    # cls._sched_cond.wait(sched_point - now)
-                    cls._sched_cond.wait(sched_secs - now)
-                    if not cls._run_sched:
-                        return
-
-                # // perform all events that are ready
-                while not cls._task_queue.empty()\
-                and now >= cls._task_queue.peek()[0]:
-                    item = cls._task_queue.pop()
-                    sched_time = item[0]
-                    task = item[1]
-                    try:
-                        _libsc3.main._update_logical_time(sched_time)
-                        _libsc3.main._in_awake_call = True
-                        delta = task.__awake__(cls)
-                        if isinstance(delta, (int, float))\
-                        and not isinstance(delta, bool):
-                            time = sched_time + delta
-                            cls._sched_add(time, task)
-                    except stm.StopStream:
-                        pass
-                    except Exception:
-                        # Always recover.
-                        _logger.error(
-                            '%s(%s) scheduled on SystemClock',
-                            type(task).__name__, task.func.__qualname__,
-                            exc_info=1)
-                    finally:
-                        _libsc3.main._in_awake_call = False
+                sched_time = queue.peek()[0]
+                delay = sched_time - elapsed_time()
+                if delay > 0:
+                    cond.wait(delay)
+                    continue
+
+                # // perform the event that is ready
+                sched_time, task = queue.pop()
+                try:
+                    update_logical_time(sched_time)
+                    main._in_awake_call = True
+                    delta = task.__awake__(cls)
+                    if isinstance(delta, (float, int))\
+                    and type(delta) is not bool:
+                        time = sched_time + delta
+                        sched_add(time, task)
+                except stm.StopStream:
+                    pass
+                except Exception:
+                    # Always recover.
+                    _logger.error(
+                        '%s(%s) scheduled on SystemClock',
+                        type(task).__name__, task.func.__qualname__,
+                        exc_info=1)
+                finally:
+                    main._in_awake_call = False
 
     @classmethod
     def clear(cls):
@@ -256,9 +269,8 @@ class SystemClock(Clock, metaclass=MetaSystemClock):
         if cls.mode == _libsc3.main.NRT_MODE:
             return
         with cls._sched_cond:
-            while not cls._task_queue.empty():
-                cls._task_queue.pop()
-            cls._sched_cond.notify_all()
+            cls._task_queue.clear()
+            cls._sched_cond.notify()
 
     @classmethod
     def sched(cls, delta, item):
@@ -326,7 +338,7 @@ class Scheduler():
             _libsc3.main._update_logical_time(self._seconds)
             _libsc3.main._in_awake_call = True
             delta = item.__awake__(self._clock)
-            if isinstance(delta, (int, float)) and not isinstance(delta, bool):
+            if isinstance(delta, (float, int)) and type(delta) is not bool:
                 self._sched_add(delta, item)
         except stm.StopStream:
             pass
@@ -366,8 +378,7 @@ class Scheduler():
         self.queue.add(time, item)
 
     def clear(self):
-        while not self.queue.empty():
-            self.queue.pop()
+        self.queue.clear()
 
     def empty(self):
         return self.queue.empty()
@@ -464,8 +475,8 @@ class AppClock(Clock, metaclass=MetaAppClock):
         while cls._run_sched:
             with cls._sched_lock:
                 seconds = cls._tick()  # First tick for free, returns None
-                if isinstance(seconds, (int, float))\
-                and not isinstance(seconds, bool):
+                if isinstance(seconds, (float, int))\
+                and type(seconds) is not bool:
                     seconds = seconds - cls._scheduler.seconds  # tick returns abstime (elapsed)
             with cls._tick_cond:  # many notify one wait
                 if not cls._run_sched:
@@ -523,19 +534,26 @@ class AppClock(Clock, metaclass=MetaAppClock):
 
 
 class ClockScheduler():
+    # ClockTask objects are only added again after being popped, they
+    # don't need TaskQueue's update/remove bookkeeping. Entries are
+    # (time, count, clock_task), count keeps insertion order for ties.
+
     def __init__(self):
-        self.queue = tsq.TaskQueue()
+        self.queue = []
+        self._counter = itertools.count()
 
     def run(self):
-        while not self.queue.empty():
-            time, clock_task = self.queue.pop()
+        queue = self.queue
+        while queue:
+            time, _, clock_task = heapq.heappop(queue)
             clock_task._wakeup(time)
 
     def add(self, time, clock_task):
-        self.queue.add(time, clock_task)
+        heapq.heappush(self.queue, (time, next(self._counter), clock_task))
 
     def reset(self):
         self.queue.clear()
+        self._counter = itertools.count()
 
 
 class ClockTask():
@@ -550,7 +568,7 @@ class ClockTask():
             _libsc3.main._update_logical_time(time)
             beats = self.clock.secs2beats(time)
             delta = self.task.__awake__(self.clock)
-            if isinstance(delta, (int, float)) and not isinstance(delta, bool):
+            if isinstance(delta, (float, int)) and type(delta) is not bool:
                 self.scheduler.add(self.clock.beats2secs(beats + delta), self)
         except stm.StopStream:
             pass
@@ -750,6 +768,7 @@ class TempoClock(Clock, metaclass=MetaTempoClock):
         if _libsc3.main is _libsc3.RtMain:
             self._pure_nrt = False
             self._task_queue = tsq.TaskQueue()
+            # Single waiter, see SystemClock.
             self._sched_cond = threading.Condition(_libsc3.main._main_lock)
             self._thread = threading.Thread(
                 target=self._run,
@@ -774,51 +793,49 @@ class TempoClock(Clock, metaclass=MetaTempoClock):
     def _run(self):
         self._run_sched = True
 
-        with self._sched_cond:
-            while True:
+        # Same loop as SystemClock._run, the lock is released only by wait.
+        main = _libsc3.main
+        elapsed_time = main.elapsed_time
+        update_logical_time = main._update_logical_time
+        queue = self._task_queue
+        cond = self._sched_cond
+        sched_add = self._sched_add
+        beats2secs = self.beats2secs
+        secs2beats = self.secs2beats
+
+        with cond:
+            while self._run_sched:
                 # // wait until there is something in scheduler
-                while self._task_queue.empty():
-                    self._sched_cond.wait()
-                    if not self._run_sched:
-                        return
+                if queue.empty():
+                    cond.wait()
+                    continue
 
                 # // wait until an event is ready
-                elapsed_beats = 0
-                while not self._task_queue.empty():
-                    elapsed_beats = self.elapsed_beats()
-                    qpeek = self._task_queue.peek()
-                    if elapsed_beats >= qpeek[0]:
-                        break
-                    sched_secs = self.beats2secs(qpeek[0])
-                    self._sched_cond.wait(
-                        sched_secs - _libsc3.main.elapsed_time())
-                    if not self._run_sched:
-                        return
-
-                # // perform all events that are ready
-                while not self._task_queue.empty()\
-                and elapsed_beats >= self._task_queue.peek()[0]:
-                    item = self._task_queue.pop()
-                    self._beats = item[0]
-                    task = item[1]
-                    try:
-                        _libsc3.main._update_logical_time(
-                            self.beats2secs(self._beats))
-                        _libsc3.main._in_awake_call = True
-                        delta = task.__awake__(self)
-                        if isinstance(delta, (int, float))\
-                        and not isinstance(delta, bool):
-                            time = self._beats + delta
-                            self._sched_add(time, task)
-                    except stm.StopStream:
-                        pass
-                    except Exception:
-                        _logger.error(
-                            '%s(%s) scheduled on TempoClock id %s',
-                            type(task).__name__, task.func.__qualname__,
-                            id(self), exc_info=1)
-                    finally:
-                        _libsc3.main._in_awake_call = False
+                sched_beats = queue.peek()[0]
+                now = elapsed_time()
+                if secs2beats(now) < sched_beats:
+                    cond.wait(beats2secs(sched_beats) - now)
+                    continue
+
+                # // perform the event that is ready
+                self._beats, task = queue.pop()
+                try:
+                    update_logical_time(beats2secs(self._beats))
+                    main._in_awake_call = True
+                    delta = task.__awake__(self)
+                    if isinstance(delta, (float, int))\
+                    and type(delta) is not bool:
+                        time = self._beats + delta
+                        sched_add(time, task)
+                except stm.StopStream:
+                    pass
+                except Exception:
+                    _logger.error(
+                        '%s(%s) scheduled on TempoClock id %s',
+                        type(task).__name__, task.func.__qualname__,
+                        id(self), exc_info=1)
+                finally:
+                    main._in_awake_call = False
 
     def stop(self):
         '''Stop the clock's scheduling thread.
@@ -848,7 +865,7 @@ class TempoClock(Clock, metaclass=MetaTempoClock):
             self._task_queue.clear()
             type(self)._all.remove(self)
             self._run_sched = False
-            self._sched_cond.notify_all()
+            self._sched_cond.notify()
         self._thread.join()
         self._thread = None
         self._sched_cond = None
@@ -1017,13 +1034,12 @@ class TempoClock(Clock, metaclass=MetaTempoClock):
         return _libsc3.main.current_tt._seconds
 
     def _sched_add(self, beats, task):
-        # Call with acquired lock.
-        if self._task_queue.empty():
-            prev_beat = -1e10
-        else:
-            prev_beat = self._task_queue.peek()[0]
-        self._task_queue.add(beats, task)
-        if self._task_queue.peek()[0] != prev_beat:
+        # Call with acquired lock. The scheduler only
+        # needs to wake up if the task is the new head.
+        queue = self._task_queue
+        new_head = queue.empty() or beats < queue.peek()[0]
+        queue.add(beats, task)
+        if new_head:
             self._sched_cond.notify()
 
     def _sched_add_nrt(self, beats, task):
@@ -1084,8 +1100,7 @@ class TempoClock(Clock, metaclass=MetaTempoClock):
             return
         if self.running():  # and self._run_sched:  # NOTE: Was needed?
             with self._sched_cond:
-                while not self._task_queue.empty():
-                    self._task_queue.pop()
+                self._task_queue.clear()
                 self._sched_cond.notify()  # NOTE: is notify_one in C++.
 
     @property
@@ -1192,11 +1207,17 @@ class TempoClock(Clock, metaclass=MetaTempoClock):
             return self.beats + phase
         if quant < 0:
             quant = self.beats_per_bar * -quant
-        if phase < 0:
-            phase = bi.mod(phase, quant)
+        # mod is the identity for phase values within [0, quant), the
+        # common case. A wrapped negative phase is wrapped again because
+        # float mod can round it up to quant (e.g. -5.55e-17 mod 4).
+        if 0 <= phase < quant:
+            offset = phase
+        else:
+            if phase < 0:
+                phase = bi.mod(phase, quant)
+            offset = bi.mod(phase, quant)
         return bi.roundup(
-            self.beats - self._base_bar_beat - bi.mod(phase, quant),
-            quant
+            self.beats - self._base_bar_beat - offset, quant
         ) + self._base_bar_beat + phase
 
     def time_to_next_beat(self, quant=1):
@@ -185,7 +185,7 @@ class RtMain(metaclass=Process):
         return time.time() - cls._init_time
 
     @classmethod
-    def _update_logical_time(cls, seconds):
+    def _update_logical_time(cls, seconds=None):
         # // When code is run from the code editor, the command line, or in
         # // response to OSC and MIDI messages, the main Thread's logical time
         # // is set to the current physical time (see Process: *elapsedTime).
@@ -198,8 +198,12 @@ class RtMain(metaclass=Process):
         # when data is schedule but can't capture code before excecution.
         # _MainTimeThread updates logical time when calling seconds property
         # and OSC updates logical time by scheduling its task in SystemClock.
+        # If seconds is None physical time is read only when it's going to
+        # be used, logical time is fixed by clocks during awake calls.
         with cls._main_lock:
             if not cls._in_awake_call:
+                if seconds is None:
+                    seconds = cls.elapsed_time()
                 cls.main_tt._m_seconds = seconds
 
 
@@ -243,25 +247,14 @@ class RtMain(metaclass=Process):
 
         if not cls._is_main_thread():
             raise Exception('main.wait() must be called from the main thread')
-        not_expired = True  # It may not even enter the while loops.
+        not_expired = True  # It may not be set if interrupted.
         with cls._wait_cond:
             try:
                 cls._wait_count += tasks
-                if timeout is None:
-                    while cls._wait_count > 0:
-                        cls._wait_cond.wait()
-                else:
-                    prev_time = curr_time = time_diff = None
-                    while cls._wait_count > 0:
-                        prev_time = time.time()
-                        not_expired = cls._wait_cond.wait(timeout)
-                        curr_time = time.time()
-                        if not_expired and cls._wait_count > 0:
-                            time_diff = curr_time - prev_time
-                            prev_time = curr_time
-                            timeout -= time_diff
-                        else:
-                            break
+                # wait_for keeps the remaining timeout with a monotonic
+                # deadline, wall clock adjustments don't affect it.
+                not_expired = cls._wait_cond.wait_for(
+                    lambda: cls._wait_count <= 0, timeout)
             except KeyboardInterrupt:
                 pass
             finally:
@@ -1,15 +1,17 @@
 """ResponseDefs.sc"""
 
 from abc import ABC, abstractmethod
+import inspect
 import logging
+import weakref
 
 from ..synth import server as srv
-from . import functions as fn
+from .functions import value as _fnvalue
 from . import systemactions as sac
 from . import model as mdl
 from . import main as _libsc3
 from . import utils as utl
-from ._oscmatch import osc_rematch_pattern as _match_osc_address_pattern
+from ._oscmatch import osc_compile_pattern as _compile_osc_address_pattern
 
 
 __all__ = ['OscFunc', 'MidiFunc', 'oscfunc', 'midifunc']
@@ -28,6 +30,26 @@ _logger = logging.getLogger(__name__)
 # public interface by now.
 
 
+def _discard(*_):
+    pass
+
+
+def _direct_call(func, nargs):
+    # Return func ready to be called with nargs positional arguments,
+    # same as fn.value but func's signature is inspected only once.
+    if not callable(func):
+        return _discard
+    try:
+        parameters = inspect.signature(func).parameters
+    except (ValueError, TypeError):
+        return lambda *args: _fnvalue(func, *args)  # Fails as before.
+    if any(p.kind == p.VAR_POSITIONAL for p in parameters.values())\
+    or len(parameters) >= nargs:
+        return func
+    func_nargs = len(parameters)
+    return lambda *args: func(*args[:func_nargs])
+
+
 class AbstractMessageMatcher(ABC):
     @abstractmethod
     def __call__(self):
@@ -84,22 +106,23 @@ class AbstractWrappingDispatcher(AbstractDispatcher):
     # // basis for the default dispatchers
     # // uses function wrappers for matching
 
+    _nargs = 0  # Number of message arguments passed to wrapped funcs.
+
     def __init__(self):
         super().__init__()
+        # Values are tuples replaced on change (copy on write), dispatch
+        # iterates them without being affected by add/remove/update.
         self.active = dict()
         self.wrapped_funcs = dict()
 
     def add(self, func_proxy):
         mdl.NotificationCenter.register(
             func_proxy, 'function', self, self.update_func_for_func_proxy)
-        func = self.wrap_func(func_proxy)
+        func = self._wrap_func(func_proxy)
         self.wrapped_funcs[func_proxy] = func
         keys = self.get_keys_for_func_proxy(func_proxy)
         for key in keys:
-            try:
-                self.active[key].append(func)
-            except KeyError:
-                self.active[key] = [func]
+            self.active[key] = self.active.get(key, ()) + (func,)
         if not self.registered:
             self.register()
 
@@ -108,24 +131,36 @@ class AbstractWrappingDispatcher(AbstractDispatcher):
         keys = self.get_keys_for_func_proxy(func_proxy)
         func = self.wrapped_funcs[func_proxy]
         for key in keys:
-            self.active[key].remove(func)
-            if not self.active[key]:
+            funcs = list(self.active[key])
+            funcs.remove(func)
+            if funcs:
+                self.active[key] = tuple(funcs)
+            else:
                 del self.active[key]
         del self.wrapped_funcs[func_proxy]
         if not self.active:
             self.unregister()
 
     def update_func_for_func_proxy(self, func_proxy):
-        func = self.wrap_func(func_proxy)
+        func = self._wrap_func(func_proxy)
         old_func = self.wrapped_funcs[func_proxy]
         self.wrapped_funcs[func_proxy] = func
         keys = self.get_keys_for_func_proxy(func_proxy)
         for key in keys:
-            i = self.active[key].index(old_func)
-            self.active[key][i] = func
+            funcs = list(self.active[key])
+            funcs[funcs.index(old_func)] = func
+            self.active[key] = tuple(funcs)
+
+    def _wrap_func(self, func_proxy):
+        # The result of wrap_func can take fewer arguments, like fn.value.
+        return _direct_call(self.wrap_func(func_proxy), self._nargs)
 
     @abstractmethod
     def wrap_func(self, func_proxy):
+        '''
+        Return the callable to be dispatched, it's called with the message
+        arguments it takes.
+        '''
         pass
 
     @abstractmethod
@@ -151,11 +186,16 @@ class AbstractResponderFunc():  # Not a real ABC.
     to an instance's function(s).
     '''
 
-    # _all_func_proxies is set()
+    # _all_func_proxies is weakref.WeakSet()
+    # _enabled_by_type and _disabled_by_type are dict() of
+    # dispatcher.type_key() -> WeakSet(), kept updated by enable/disable/free.
+    # Enabled responders are referenced by their dispatcher, disabled and
+    # not freed responders are collected when no longer referenced.
 
     def __init__(self):
         self._func = None
         self._permanent = False
+        self._one_shot = False
         self.enabled = False
         self.dispatcher = None
 
@@ -193,6 +233,7 @@ class AbstractResponderFunc():  # Not a real ABC.
             self.dispatcher.add(self)
             self.enabled = True
             type(self)._all_func_proxies.add(self)
+            self._update_type_index(type(self)._enabled_by_type)
 
     def disable(self):
         '''Disable the responder, no data is processed.'''
@@ -201,14 +242,22 @@ class AbstractResponderFunc():  # Not a real ABC.
                 sac.CmdPeriod.remove(self.__on_cmd_period)
             self.dispatcher.remove(self)
             self.enabled = False
+            if self in type(self)._all_func_proxies:
+                self._update_type_index(type(self)._disabled_by_type)
 
     def one_shot(self):
         '''Make the responder a one time action.'''
+        # The function is wrapped once, dispatchers call it only after
+        # their filters matched so the responder is freed by its first
+        # accepted message.
+        if self._one_shot:
+            return
+        self._one_shot = True
         wrapped_func = self._func
 
         def one_shot_func(*args):
             self.free()
-            fn.value(wrapped_func, *args)
+            _fnvalue(wrapped_func, *args)
 
         self.func = one_shot_func
 
@@ -223,10 +272,22 @@ class AbstractResponderFunc():  # Not a real ABC.
         '''
 
         cls = type(self)
-        if self in cls._all_func_proxies:
-            cls._all_func_proxies.remove(self)
+        cls._all_func_proxies.discard(self)
         if self.enabled:
             self.disable()
+        self._update_type_index(None)
+
+    def _update_type_index(self, index):
+        # Move self to index (None removes it) under its dispatcher type.
+        cls = type(self)
+        key = self.dispatcher.type_key()
+        for other in (cls._enabled_by_type, cls._disabled_by_type):
+            if other is not index and key in other:
+                other[key].discard(self)
+                if not other[key]:
+                    del other[key]
+        if index is not None:
+            index.setdefault(key, weakref.WeakSet()).add(self)
 
     # def clear(self):
     #     '''Clear the responder's function.'''
@@ -239,13 +300,9 @@ class AbstractResponderFunc():  # Not a real ABC.
         concrete subclasses, sorted by type.
         '''
 
-        result = dict()
-        for func_proxy in cls._all_func_proxies:
-            key = func_proxy.dispatcher.type_key()
-            try:
-                result[key].append(func_proxy)
-            except KeyError:
-                result[key] = [func_proxy]
+        result = cls._all_enabled()
+        for key, func_proxies in cls._all_disabled().items():
+            result[key] = result.get(key, []) + func_proxies
         return result
 
     @classmethod
@@ -255,15 +312,7 @@ class AbstractResponderFunc():  # Not a real ABC.
         responders' dispatchers by `type_name`.
         '''
 
-        result = dict()
-        enabled_proxies = [x for x in cls._all_func_proxies if x.enabled]
-        for func_proxy in enabled_proxies:
-            key = func_proxy.dispatcher.type_key()
-            try:
-                result[key].append(func_proxy)
-            except KeyError:
-                result[key] = [func_proxy]
-        return result
+        return cls._index_lists(cls._enabled_by_type)
 
     @classmethod
     def _all_disabled(cls):
@@ -272,14 +321,16 @@ class AbstractResponderFunc():  # Not a real ABC.
         responders' dispatchers by `type_name`.
         '''
 
+        return cls._index_lists(cls._disabled_by_type)
+
+    @staticmethod
+    def _index_lists(index):
+        # Sets may be emptied by the gc.
         result = dict()
-        disabled_proxies = [x for x in cls._all_func_proxies if not x.enabled]
-        for func_proxy in disabled_proxies:
-            key = func_proxy.dispatcher.type_key()
-            try:
-                result[key].append(func_proxy)
-            except KeyError:
-                result[key] = [func_proxy]
+        for key, func_proxies in index.items():
+            func_proxies = list(func_proxies)
+            if func_proxies:
+                result[key] = func_proxies
         return result
 
 
@@ -297,11 +348,21 @@ class OscFuncAddrMessageMatcher(AbstractMessageMatcher):
     def __init__(self, addr, func):
         self.addr = addr
         self.func = func
+        self._call = _direct_call(func, 4)
+        # NetAddr is immutable, a None port matches any port (was matchItem).
+        self._with_port = addr.port is not None
+        if self._with_port:
+            self._key = (addr.addr, addr.port)
+        else:
+            self._key = addr.addr
 
     def __call__(self, msg, time, addr, recv_port):
-        if self.addr.addr == addr.addr\
-        and (self.addr.port is None or self.addr.port == addr.port):  # was matchItem
-            fn.value(self.func, msg, time, addr, recv_port)
+        if self._with_port:
+            if (addr.addr, addr.port) != self._key:
+                return
+        elif addr.addr != self._key:
+            return
+        self._call(msg, time, addr, recv_port)
 
 
 class OscFuncRecvPortMessageMatcher(AbstractMessageMatcher):
@@ -309,10 +370,11 @@ class OscFuncRecvPortMessageMatcher(AbstractMessageMatcher):
     def __init__(self, recv_port, func):
         self.recv_port = recv_port
         self.func = func
+        self._call = _direct_call(func, 4)
 
     def __call__(self, msg, time, addr, recv_port):
         if self.recv_port == recv_port:
-            fn.value(self.func, msg, time, addr, recv_port)
+            self._call(msg, time, addr, recv_port)
 
 
 class OscFuncBothMessageMatcher(AbstractMessageMatcher):
@@ -320,28 +382,58 @@ class OscFuncBothMessageMatcher(AbstractMessageMatcher):
         self.addr = addr
         self.recv_port = recv_port
         self.func = func
+        self._call = _direct_call(func, 4)
+        # Same as OscFuncAddrMessageMatcher.
+        self._with_port = addr.port is not None
+        if self._with_port:
+            self._key = (addr.addr, addr.port, recv_port)
+        else:
+            self._key = (addr.addr, recv_port)
 
     def __call__(self, msg, time, addr, recv_port):
-        if  self.addr.addr == addr.addr\
-        and (self.addr.port is None or self.addr.port == addr.port)\
-        and self.recv_port == recv_port:
-            fn.value(self.func, msg, time, addr, recv_port)
+        if self._with_port:
+            if (addr.addr, addr.port, recv_port) != self._key:
+                return
+        elif (addr.addr, recv_port) != self._key:
+            return
+        self._call(msg, time, addr, recv_port)
 
 
 class OscArgsMatcher(AbstractMessageMatcher):
     def __init__(self, arg_template, func):
         self.arg_template = utl.as_list(arg_template)
         self.func = func
+        self._call = _direct_call(func, 4)
+        # Checks are made by message index (args start at 1), None matches
+        # any value, also a missing one, and messages shorter than the last
+        # check don't match. If all items are values msg (a list) is
+        # compared by slice.
+        self._checks = [
+            (i, item, callable(item))
+            for i, item in enumerate(self.arg_template, 1)
+            if item is not None]
+        self._size = self._checks[-1][0] + 1 if self._checks else 1
+        if len(self._checks) == len(self.arg_template)\
+        and not any(is_func for _, _, is_func in self._checks):
+            self._values = list(self.arg_template)
+        else:
+            self._values = None
 
     def __call__(self, msg, time, addr, recv_port):
-        args = msg[1:]
-        for i, item in enumerate(self.arg_template):
-            if callable(item):
-                if not item(args[i]):
-                    return
-            elif item is not None and item != args[i]:
+        if len(msg) < self._size:
+            return
+        values = self._values
+        if values is not None:
+            if msg[1:self._size] != values:
                 return
-        fn.value(self.func, msg, time, addr, recv_port)
+        else:
+            for i, item, is_func in self._checks:
+                if is_func:
+                    if not item(msg[i]):
+                        return
+                elif item != msg[i]:
+                    return
+        self._call(msg, time, addr, recv_port)
 
 
 # // The default dispatchers below store by the 'most significant'
@@ -349,6 +441,8 @@ class OscArgsMatcher(AbstractMessageMatcher):
 # // than just the 'most significant' argument needs to be matched.
 
 class OscMessageDispatcher(AbstractWrappingDispatcher):
+    _nargs = 4
+
     def wrap_func(self, func_proxy):
         func = func_proxy.func
         src_id = func_proxy.src_id
@@ -369,9 +463,10 @@ class OscMessageDispatcher(AbstractWrappingDispatcher):
         return [func_proxy.path]
 
     def __call__(self, msg, time, addr, recv_port):
-        if msg[0] in self.active:
-            for func in self.active[msg[0]]:
-                fn.value(func, msg, time, addr, recv_port)
+        funcs = self.active.get(msg[0])
+        if funcs is not None:
+            for func in funcs:
+                func(msg, time, addr, recv_port)
 
     def register(self):
         _libsc3.main.add_osc_recv_func(self) # thisProcess.addOSCRecvFunc(this)
@@ -386,12 +481,42 @@ class OscMessageDispatcher(AbstractWrappingDispatcher):
 
 
 class OscMessagePatternDispatcher(OscMessageDispatcher):
+    _MATCH_CACHE_SIZE = 256
+
+    def __init__(self):
+        super().__init__()
+        # Matching funcs by incoming pattern. The cache is replaced, not
+        # cleared, when active changes so a concurrent dispatch can only
+        # store its result in the discarded one.
+        self._match_cache = dict()
+
+    def add(self, func_proxy):
+        super().add(func_proxy)
+        self._match_cache = dict()
+
+    def remove(self, func_proxy):
+        super().remove(func_proxy)
+        self._match_cache = dict()
+
+    def update_func_for_func_proxy(self, func_proxy):
+        super().update_func_for_func_proxy(func_proxy)
+        self._match_cache = dict()
+
     def __call__(self, msg, time, addr, recv_port):
         pattern = msg[0]
-        for key, funcs in self.active.copy().items():
-            if _match_osc_address_pattern(pattern, key):
-                for func in funcs:
-                    fn.value(func, msg, time, addr, recv_port)
+        cache = self._match_cache
+        funcs = cache.get(pattern)
+        if funcs is None:
+            # The pattern is compiled once and matched against every key.
+            match = _compile_osc_address_pattern(pattern).match
+            funcs = tuple(
+                func for key, key_funcs in self.active.copy().items()
+                if match(key) is not None for func in key_funcs)
+            if len(cache) >= self._MATCH_CACHE_SIZE:
+                cache.clear()
+            cache[pattern] = funcs
+        for func in funcs:
+            func(msg, time, addr, recv_port)
 
     def type_key(self):
         return 'OSC matched'
@@ -447,7 +572,9 @@ class OscFunc(AbstractResponderFunc):
         should not be needed and it requires to use the internal interface.
     '''
 
-    _all_func_proxies = set()
+    _all_func_proxies = weakref.WeakSet()
+    _enabled_by_type = dict()
+    _disabled_by_type = dict()
 
     _default_dispatcher = OscMessageDispatcher()
     '''
@@ -573,28 +700,37 @@ class MidiFuncRecvPortMessageMatcher(AbstractMessageMatcher):
     def __init__(self, midi_in, func):
         self.midi_in = midi_in
         self.func = func
+        self._call = _direct_call(func, 2)
 
     def __call__(self, data, midi_in):
         if self.midi_in._name == midi_in._name:
-            fn.value(self.func, data, midi_in)
+            self._call(data, midi_in)
 
 
 class MidiArgsMatcher(AbstractMessageMatcher):
     def __init__(self, arg_template, func):
         self.arg_template = arg_template
         self.func = func
+        self._call = _direct_call(func, 2)
+        # Same as OscArgsMatcher, checks are made by key.
+        self._checks = [
+            (key, item, callable(item))
+            for key, item in arg_template.items()
+            if item is not None]
 
     def __call__(self, data, midi_in):
-        for key, item in self.arg_template.items():
-            if callable(item):
+        for key, item, is_func in self._checks:
+            if is_func:
                 if not item(data[key]):
                     return
-            elif item is not None and item != data[key]:
+            elif item != data[key]:
                 return
-        fn.value(self.func, data, midi_in)
+        self._call(data, midi_in)
 
 
 class MidiMessageDispatcher(AbstractWrappingDispatcher):
+    _nargs = 2
+
     def wrap_func(self, func_proxy):
         func = func_proxy.func
         midi_in = func_proxy.port
@@ -614,10 +750,10 @@ class MidiMessageDispatcher(AbstractWrappingDispatcher):
             return [mm]
 
     def __call__(self, data, midi_in):
-        mt = data['type']
-        if mt in self.active:
-            for func in self.active[mt]:
-                fn.value(func, data, midi_in)
+        funcs = self.active.get(data['type'])
+        if funcs is not None:
+            for func in funcs:
+                func(data, midi_in)
 
     def register(self):
         _libsc3.main._midi_interface.add_recv_func(self)
@@ -634,7 +770,9 @@ class MidiMessageDispatcher(AbstractWrappingDispatcher):
 class MidiFunc(AbstractResponderFunc):
     # Constructor was changed to use mido's message model and parser.
 
-    _all_func_proxies = set()
+    _all_func_proxies = weakref.WeakSet()
+    _enabled_by_type = dict()
+    _disabled_by_type = dict()
     _default_dispatcher = MidiMessageDispatcher()
     _trace_running = False
 
@@ -116,7 +116,7 @@ class _MainTimeThread(TimeThread):
         # In RT _MainThread sets logical time to physical time when
         # this property is invoked and then spreads to child routines.
         if _libsc3.main is _libsc3.RtMain:
-            _libsc3.main._update_logical_time(_libsc3.main.elapsed_time())
+            _libsc3.main._update_logical_time()
         return self._m_seconds
 
     @property
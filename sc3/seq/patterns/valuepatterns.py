@@ -7,6 +7,10 @@ from .. import pattern as ptt
 from .. import eventstream as est
 
 
+# Parameter types with constant pattern fast paths.
+_NUMBER_TYPES = (int, float)
+
+
 class ValuePattern(ptt.Pattern):
     def __stream__(self):
         return est.PatternValueStream(self)
@@ -37,6 +41,15 @@ class Pseries(ValuePattern):
     def __embed__(self, inval):
         cur = self.start  # value makes the pattern object to keep state
         length = self.length  # if the parameter is a stream.
+        if type(self.step) in _NUMBER_TYPES:
+            # Constant step, accumulated as in the stream case.
+            stepval = self.step
+            for _ in bi.counter(length):
+                outval = cur
+                cur += stepval
+                inval = yield outval
+            return inval
+
         step_stream = stm.stream(self.step)
         outval = stepval = None
         try:
@@ -62,6 +75,15 @@ class Pgeom(ValuePattern):
     def __embed__(self, inval):
         cur = self.start
         length = self.length
+        if type(self.grow) in _NUMBER_TYPES:
+            # Constant grow, accumulated as in the stream case.
+            growval = self.grow
+            for _ in bi.counter(length):
+                outval = cur
+                cur *= growval
+                inval = yield outval
+            return inval
+
         grow_stream = stm.stream(self.grow)
         outval = growval = None
         try:
@@ -85,20 +107,35 @@ class Pbrown(ValuePattern):
         self.length = length
 
     def __embed__(self, inval):
-        lo_stream = stm.stream(self.lo)
-        hi_stream = stm.stream(self.hi)
-        step_stream = stm.stream(self.step)
+        lo = self.lo
+        hi = self.hi
+        step = self.step
+        # Per value calls bound once.
+        rrand = bi.rrand
+        fold = bi.fold
+        calc_next = self._calc_next
+        if type(lo) in _NUMBER_TYPES and type(hi) in _NUMBER_TYPES\
+        and type(step) in _NUMBER_TYPES:
+            # Constant parameters, same random walk without stream calls.
+            current = rrand(lo, hi)
+            for _ in bi.counter(self.length):
+                current = fold(calc_next(current, step), lo, hi)
+                inval = yield current
+            return inval
+
+        lo_stream = stm.stream(lo)
+        hi_stream = stm.stream(hi)
+        step_stream = stm.stream(step)
         try:
             loval = lo_stream.next(inval)
             hival = hi_stream.next(inval)
             stepval = step_stream.next(inval)
-            current = bi.rrand(loval, hival)
+            current = rrand(loval, hival)
             for _ in bi.counter(self.length):
                 loval = lo_stream.next(inval)
                 hival = hi_stream.next(inval)
                 stepval = step_stream.next(inval)
-                current = bi.fold(
-                    self._calc_next(current, stepval), loval, hival)
+                current = fold(calc_next(current, stepval), loval, hival)
                 inval = yield current
         except stm.StopStream:
             pass
@@ -122,14 +159,27 @@ class Pwhite(ValuePattern):
         self.length = length
 
     def __embed__(self, inval):
-        lo_stream = stm.stream(self.lo)
-        hi_stream = stm.stream(self.hi)
+        lo = self.lo
+        hi = self.hi
+        if type(lo) in _NUMBER_TYPES and type(hi) in _NUMBER_TYPES:
+            # Constant range, values are drawn one by one from the current
+            # rgen (seeding is per routine) without the stream calls and
+            # the scbuiltin wrapper.
+            rrand = bi.rrand_number
+            for _ in bi.counter(self.length):
+                inval = yield rrand(lo, hi)
+            return inval
+
+        rrand = bi.rrand
+
+        lo_stream = stm.stream(lo)
+        hi_stream = stm.stream(hi)
         hival = loval = None
         try:
             for _ in bi.counter(self.length):
                 loval = lo_stream.next(inval)
                 hival = hi_stream.next(inval)
-                inval = yield bi.rrand(loval, hival)
+                inval = yield rrand(loval, hival)
         except stm.StopStream:
             pass
         return inval
@@ -150,14 +200,24 @@ class Pprob(ValuePattern):
 
     def __embed__(self, inval):
         table = self.table
-        lo_stream = stm.stream(self.lo)
-        hi_stream = stm.stream(self.hi)
+        table_rand = bi.table_rand
+        lo = self.lo
+        hi = self.hi
+        if type(lo) in _NUMBER_TYPES and type(hi) in _NUMBER_TYPES:
+            # Constant range, same as Pwhite.
+            span = hi - lo
+            for _ in bi.counter(self.length):
+                inval = yield (table_rand(table) * span) + lo
+            return inval
+
+        lo_stream = stm.stream(lo)
+        hi_stream = stm.stream(hi)
         lval = hval = None
         try:
             for _ in bi.counter(self.length):
                 lval = lo_stream.next(inval)
                 hval = hi_stream.next(inval)
-                inval = yield (bi.table_rand(table) * (hval - lval)) + lval
+                inval = yield (table_rand(table) * (hval - lval)) + lval
         except stm.StopStream:
             pass
         return inval
@@ -75,6 +75,23 @@ class ClockTestCase(unittest.TestCase):
         example.play()
         main.process()
 
+    def test_next_time_on_grid(self):
+        result = []
+
+        @routine
+        def example():
+            t = TempoClock(1, 10.3)
+            result.append(t.next_time_on_grid())
+            result.append(t.next_time_on_grid(4, 2))
+            result.append(t.next_time_on_grid(4, 6))
+            result.append(t.next_time_on_grid(4, -1))
+            # A negative phase that wraps to quant in float.
+            result.append(t.next_time_on_grid(4, -5.55e-17))
+
+        example.play()
+        main.process()
+        self.assertEqual(result, [11, 14, 18, 11, 16])
+
     # def test_logical_and_bundle_time(self):  # No use for nrt.
 
 
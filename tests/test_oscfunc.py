@@ -1,12 +1,15 @@
 
 import unittest
+import weakref
+import gc
 
 import sc3
 sc3.init()
 
 from sc3.base.main import main
 from sc3.base.netaddr import NetAddr
-from sc3.base.responders import OscFunc
+from sc3.base.responders import (
+    OscFunc, AbstractDispatcher, OscMessageDispatcher)
 
 
 class OscFuncTestCase(unittest.TestCase):
@@ -107,6 +110,43 @@ class OscFuncTestCase(unittest.TestCase):
         oscf.free()
         self.assertTrue(test_ok, 'test time expired')
 
+    def test_arg_template_values(self):
+        osc_addr = '/arg_template_values_msg'
+        values_template = ['string', 0.5, 3]
+        osc_values = ['string', 0.5, 3, 'extra']
+
+        def recvf(msg):
+            self.assertEqual(msg[1:], osc_values)
+            main.resume()
+
+        oscf = OscFunc(recvf, osc_addr, arg_template=values_template)
+        addr = NetAddr(*NetAddr.lang_endpoints()[0][:2])
+        addr.send_msg(osc_addr, 'string')  # Ignored, shorter than template.
+        addr.send_msg(osc_addr, 'string', 0.5, 4)  # Ignored, not matching.
+        addr.send_msg(osc_addr, *osc_values)
+        test_ok = main.wait(self.TEST_TIME)
+        oscf.free()
+        self.assertTrue(test_ok, 'test time expired')
+
+    def test_arg_template_trailing_none(self):
+        osc_addr = '/arg_template_trailing_none_msg'
+        result = []
+
+        def recvf(msg):
+            result.append(msg[1:])
+            main.resume()
+
+        oscf = OscFunc(recvf, osc_addr, arg_template=[1, None, None])
+        addr = NetAddr(*NetAddr.lang_endpoints()[0][:2])
+        addr.send_msg(osc_addr)  # Ignored, shorter than the last check.
+        addr.send_msg(osc_addr, 2)  # Ignored, not matching.
+        addr.send_msg(osc_addr, 1)  # Missing wildcards match.
+        addr.send_msg(osc_addr, 1, 'any')
+        test_ok = main.wait(self.TEST_TIME, tasks=2)
+        oscf.free()
+        self.assertTrue(test_ok, 'test time expired')
+        self.assertEqual(result, [[1], [1, 'any']])
+
     def test_matching(self):
         glob_addr = '/m?t{ch,Ch}[a-z]n[!a-f]_*'
         osc_addr = '/matChing_msg'
@@ -122,6 +162,33 @@ class OscFuncTestCase(unittest.TestCase):
         oscf.free()
         self.assertTrue(test_ok, 'test time expired')
 
+    def test_matching_changes(self):
+        # Matches for a repeated pattern follow added/removed responders.
+        glob_addr = '/changes_?_msg'
+        result = []
+
+        def recvf_a(msg):
+            result.append('a')
+            main.resume()
+
+        def recvf_b(msg):
+            result.append('b')
+            main.resume()
+
+        addr = NetAddr(*NetAddr.lang_endpoints()[0][:2])
+        oscf_a = OscFunc.matching(recvf_a, '/changes_a_msg')
+        addr.send_msg(glob_addr)
+        self.assertTrue(main.wait(self.TEST_TIME), 'test time expired')
+        oscf_b = OscFunc.matching(recvf_b, '/changes_b_msg')
+        addr.send_msg(glob_addr)
+        self.assertTrue(main.wait(self.TEST_TIME, tasks=2), 'test time expired')
+        oscf_a.free()
+        addr.send_msg(glob_addr)
+        self.assertTrue(main.wait(self.TEST_TIME), 'test time expired')
+        oscf_b.free()
+        self.assertEqual(sorted(result), ['a', 'a', 'b', 'b'])
+        self.assertEqual(result[-1], 'b')
+
     def test_enable_disable(self):
         osc_addr = '/enable_disable_msg'
 
@@ -144,6 +211,36 @@ class OscFuncTestCase(unittest.TestCase):
         self.assertTrue(test_ok, 'test time expired')
         self.assertFalse(oscf.enabled)
 
+    def test_all_enabled_disabled(self):
+        oscf = OscFunc(lambda: None, '/all_enabled_msg')
+        matching = OscFunc.matching(lambda: None, '/all_enabled_msg')
+        self.assertIn(oscf, OscFunc._all_enabled()['OSC unmatched'])
+        self.assertIn(matching, OscFunc._all_enabled()['OSC matched'])
+        oscf.disable()
+        self.assertNotIn(oscf, OscFunc._all_enabled().get('OSC unmatched', []))
+        self.assertIn(oscf, OscFunc._all_disabled()['OSC unmatched'])
+        oscf.enable()
+        self.assertIn(oscf, OscFunc._all_enabled()['OSC unmatched'])
+        self.assertNotIn(oscf, OscFunc._all_disabled().get('OSC unmatched', []))
+        oscf.disable()
+        oscf.free()
+        matching.free()
+        for result in (OscFunc._all_enabled(), OscFunc._all_disabled()):
+            for func_proxies in result.values():
+                self.assertNotIn(oscf, func_proxies)
+                self.assertNotIn(matching, func_proxies)
+
+    def test_disabled_collected(self):
+        oscf = OscFunc(lambda: None, '/disabled_collected_msg')
+        oscf.disable()
+        ref = weakref.ref(oscf)
+        del oscf
+        gc.collect()
+        self.assertIsNone(ref())
+        for func_proxies in OscFunc._all_disabled().values():
+            for func_proxy in func_proxies:
+                self.assertNotEqual(func_proxy.path, '/disabled_collected_msg')
+
     def test_one_shot(self):
         osc_addr = '/one_shot_msg'
 
@@ -160,6 +257,96 @@ class OscFuncTestCase(unittest.TestCase):
         self.assertFalse(oscf.enabled)
         self.assertTrue(test_ok, 'test time expired')
 
+    def test_one_shot_filtered(self):
+        # Not matching messages don't consume the one shot.
+        osc_addr = '/one_shot_filtered_msg'
+        result = []
+
+        def recvf(msg):
+            result.append(msg[1])
+            main.resume()
+
+        oscf = OscFunc(recvf, osc_addr, arg_template=[1])
+        oscf.one_shot()
+        addr = NetAddr(*NetAddr.lang_endpoints()[0][:2])
+        addr.send_msg(osc_addr, 2)  # Ignored, not matching template.
+        addr.send_msg(osc_addr, 1)
+        addr.send_msg(osc_addr, 1)  # Ignored, already freed.
+        test_ok = main.wait(self.TEST_TIME)
+        self.assertTrue(test_ok, 'test time expired')
+        self.assertFalse(oscf.enabled)
+        self.assertEqual(result, [1])
+
+    def test_one_shot_custom_dispatcher(self):
+        class Dispatcher(AbstractDispatcher):
+            def __init__(self):
+                super().__init__()
+                self.func_proxies = []
+
+            def add(self, func_proxy):
+                self.func_proxies.append(func_proxy)
+
+            def remove(self, func_proxy):
+                self.func_proxies.remove(func_proxy)
+
+            def __call__(self, msg, time, addr, recv_port):
+                for func_proxy in self.func_proxies[:]:
+                    func_proxy.func(msg, time, addr, recv_port)
+
+            def register(self):
+                pass
+
+            def unregister(self):
+                pass
+
+            def type_key(self):
+                return 'OSC custom'
+
+        result = []
+        dispatcher = Dispatcher()
+        oscf = OscFunc(
+            lambda msg: result.append(msg[0]), '/custom_msg',
+            dispatcher=dispatcher)
+        oscf.one_shot()
+        dispatcher(['/custom_msg'], 0.0, None, 0)
+        dispatcher(['/custom_msg'], 0.0, None, 0)
+        self.assertFalse(oscf.enabled)
+        self.assertEqual(result, ['/custom_msg'])
+
+    def test_one_shot_custom_wrap_func(self):
+        class Dispatcher(OscMessageDispatcher):
+            def wrap_func(self, func_proxy):
+                func = func_proxy.func
+                return lambda msg, *_: func(msg, None, None, None)
+
+        result = []
+        dispatcher = Dispatcher()
+        oscf = OscFunc(
+            lambda msg, *_: result.append(msg[0]), '/custom_wrap_msg',
+            dispatcher=dispatcher)
+        oscf.one_shot()
+        dispatcher(['/custom_wrap_msg'], 0.0, None, 0)
+        dispatcher(['/custom_wrap_msg'], 0.0, None, 0)
+        self.assertFalse(oscf.enabled)
+        self.assertEqual(result, ['/custom_wrap_msg'])
+
+    def test_custom_wrap_func_args(self):
+        # wrap_func can return a function taking fewer arguments.
+        class Dispatcher(OscMessageDispatcher):
+            def wrap_func(self, func_proxy):
+                return func_proxy.func
+
+        result = []
+        dispatcher = Dispatcher()
+        oscf = OscFunc(
+            lambda msg: result.append(msg[0]), '/custom_args_msg',
+            dispatcher=dispatcher)
+        dispatcher(['/custom_args_msg'], 0.0, None, 0)
+        oscf.func = lambda: result.append(None)
+        dispatcher(['/custom_args_msg'], 0.0, None, 0)
+        oscf.free()
+        self.assertEqual(result, ['/custom_args_msg', None])
+
     # def test_trace(self):
     #     ...
 
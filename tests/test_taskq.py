@@ -0,0 +1,52 @@
+
+import unittest
+
+from sc3.base._taskq import TaskQueue
+
+
+class TaskQueueTestCase(unittest.TestCase):
+    class Task():
+        # Not comparable, ties must never fall back to compare tasks.
+        __eq__ = None
+        __lt__ = None
+        __hash__ = object.__hash__
+
+    def test_ties(self):
+        q = TaskQueue()
+        tasks = [self.Task() for _ in range(10)]
+        for task in tasks:
+            q.add(1.0, task)
+        self.assertIs(q.peek()[1], tasks[0])
+        result = [q.pop()[1] for _ in range(len(tasks))]
+        self.assertEqual([id(t) for t in result], [id(t) for t in tasks])
+        self.assertTrue(q.empty())
+
+    def test_update_and_remove(self):
+        q = TaskQueue()
+        a, b, c = self.Task(), self.Task(), self.Task()
+        q.add(1, a)
+        q.add(2, b)
+        q.add(3, c)
+        q.add(4, a)  # Re-adding updates the prio.
+        self.assertEqual(q.peek(), (2, b))
+        q.remove(b)
+        self.assertEqual(q.peek(), (3, c))
+        self.assertEqual(q.peek(False), (4, a))
+        self.assertEqual(list(q), [(3, c), (4, a)])
+        self.assertEqual(q.pop(), (3, c))
+        self.assertEqual(q.pop(), (4, a))
+        self.assertTrue(q.empty())
+        self.assertRaises(KeyError, q.peek)
+        self.assertRaises(KeyError, q.pop)
+
+    def test_clear(self):
+        q = TaskQueue()
+        for i in range(5):
+            q.add(i, self.Task())
+        q.clear()
+        self.assertTrue(q.empty())
+        self.assertRaises(KeyError, q.peek)
+
+
+if __name__ == '__main__':
+    unittest.main()
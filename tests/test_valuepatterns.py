@@ -37,6 +37,53 @@ class ValuePatternsTestCase(unittest.TestCase):
         for r, t in zip(result, [0.0, 0.5, 1] * 2):
             self.assertTrue(math.isclose(r, t))
 
+    def test_pseries_pgeom(self):
+        inf = float('inf')
+        self.assertEqual(list(Pseries(1, 2, 4)), [1, 3, 5, 7])
+        self.assertEqual(list(Pgeom(1, 2, 4)), [1, 2, 4, 8])
+        # Constant and stream parameters accumulate the same way.
+        self.assertEqual(
+            list(Pseries(0.0, 0.1, 50)), list(Pseries(0.0, Pseq([0.1], inf), 50)))
+        self.assertEqual(
+            list(Pgeom(1.0, 1.1, 50)), list(Pgeom(1.0, Pseq([1.1], inf), 50)))
+
+    def seeded_list(self, pattern, seed=1234):
+        main._m_rgen.seed(seed)
+        return list(pattern)
+
+    def test_pwhite(self):
+        # Constant and stream parameters draw the same sequence.
+        inf = float('inf')
+        for lo, hi in ((0.0, 1.0), (-2, 3.5), (0, 10), (10, 0)):
+            const = self.seeded_list(Pwhite(lo, hi, 20))
+            streams = self.seeded_list(
+                Pwhite(Pseq([lo], inf), Pseq([hi], inf), 20))
+            self.assertEqual(const, streams)
+            self.assertEqual(len(const), 20)
+            for value in const:
+                self.assertTrue(min(lo, hi) <= value <= max(lo, hi))
+
+    def test_pprob(self):
+        inf = float('inf')
+        dist = [0, 1, 4, 1, 0]
+        const = self.seeded_list(Pprob(dist, 2, 5.0, length=20))
+        streams = self.seeded_list(
+            Pprob(dist, Pseq([2], inf), Pseq([5.0], inf), length=20))
+        self.assertEqual(const, streams)
+        for value in const:
+            self.assertTrue(2 <= value <= 5.0)
+
+    def test_pbrown(self):
+        inf = float('inf')
+        for cls in (Pbrown, Pgbrown):
+            for lo, hi, step in ((0.0, 1.0, 0.125), (1, 10, 2), (1.0, 2.0, 0.5)):
+                const = self.seeded_list(cls(lo, hi, step, 30))
+                streams = self.seeded_list(cls(
+                    Pseq([lo], inf), Pseq([hi], inf), Pseq([step], inf), 30))
+                self.assertEqual(const, streams)
+                for value in const:
+                    self.assertTrue(lo <= value <= hi)
+
 
 if __name__ == '__main__':
     unittest.main()